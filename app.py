@@ -1,5 +1,7 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 import os
 import pandas as pd
@@ -8,33 +10,99 @@ import matplotlib.pyplot as plt
 # Configuration
 API_URL = "http://127.0.0.1:8000"
 VIS_DIR = "visualizations"
+REQUEST_TIMEOUT = (3, 30)  # (connect, read) seconds
+STATUS_TIMEOUT = (3, 5)  # short read timeout so a busy API never stalls the page
+STATUS_TTL = 5  # seconds to reuse a health response across reruns/sessions
+VIS_TTL = 60  # seconds to reuse loaded visualization images
+MAX_WORKERS = 4  # concurrent prediction requests per batch
+POOL_SIZE = 32  # keep-alive connections shared by all operators' sessions
 
 st.set_page_config(page_title="Flower Prediction Dashboard", layout="wide")
 
+
+@st.cache_resource
+def get_session():
+    """Shared HTTP session with a keep-alive connection pool."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=STATUS_TTL, show_spinner=False)
+def fetch_status():
+    """Fetches /health. Returns (status dict or None, error message or None)."""
+    try:
+        response = get_session().get(f"{API_URL}/health", timeout=STATUS_TIMEOUT)
+    except requests.exceptions.RequestException:
+        return None, "API is Offline. Please start the API server."
+    if response.status_code != 200:
+        return None, "API is reachable but returned an error."
+    try:
+        return response.json(), None
+    except ValueError:
+        return None, "API returned an invalid status response."
+
+
+@st.cache_data(ttl=VIS_TTL, show_spinner=False)
+def load_visualization(filename):
+    """Loads a plot from VIS_DIR, or returns None if it does not exist."""
+    path = os.path.join(VIS_DIR, filename)
+    if not os.path.exists(path):
+        return None
+    with Image.open(path) as image:
+        image.load()
+        return image.copy()
+
+
+def predict_image(name, data):
+    """Posts one image to /predict. Returns (result dict or None, error or None)."""
+    try:
+        response = get_session().post(
+            f"{API_URL}/predict",
+            files={"file": (name, data)},
+            timeout=REQUEST_TIMEOUT,
+        )
+    except requests.exceptions.RequestException as e:
+        return None, f"Error: {e}"
+    if response.status_code != 200:
+        return None, f"Prediction failed: {response.text}"
+    try:
+        return response.json(), None
+    except ValueError:
+        return None, f"Prediction failed: invalid response: {response.text}"
+
+
 st.title("🌸 Flower Prediction Dashboard")
 
 # Sidebar for controls
 st.sidebar.header("Controls")
+if st.sidebar.button("Refresh Status"):
+    fetch_status.clear()
 
 # 1. Model Up-time / Status
 st.header("1. System Status")
-try:
-    response = requests.get(f"{API_URL}/")
-    if response.status_code == 200:
-        status = response.json()
-        st.success(f"API is Online. Message: {status['message']}")
-        st.info(f"Model Status: {status['model_status']}")
-    else:
-        st.error("API is reachable but returned an error.")
-except requests.exceptions.ConnectionError:
-    st.error("API is Offline. Please start the API server.")
+status, error = fetch_status()
+if status is not None:
+    st.success(f"API is Online. Message: {status['message']}")
+    st.info(f"Model Status: {status['model_status']}")
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Uptime", f"{status['uptime'] / 60:.1f} min")
+    m2.metric("Total Predictions", status['total_predictions'])
+    m3.metric("Avg Inference", f"{status['avg_inference'] * 1000:.0f} ms")
+    m4.metric("CPU Usage", f"{status['cpu_usage']:.1f}%")
+else:
+    st.error(error)
 
 # 2. Retraining Trigger
 st.sidebar.subheader("Model Management")
 if st.sidebar.button("Trigger Retraining"):
     with st.spinner("Triggering training..."):
         try:
-            response = requests.post(f"{API_URL}/train?force=true")
+            response = get_session().post(
+                f"{API_URL}/train", params={"force": "true"}, timeout=REQUEST_TIMEOUT
+            )
             if response.status_code == 200:
                 st.sidebar.success("Training triggered successfully!")
                 st.sidebar.json(response.json())
@@ -49,45 +117,47 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("Training History")
-    history_path = os.path.join(VIS_DIR, "training_history.png")
-    if os.path.exists(history_path):
-        st.image(history_path, caption="Accuracy & Loss")
+    history = load_visualization("training_history.png")
+    if history is not None:
+        st.image(history, caption="Accuracy & Loss")
     else:
         st.warning("Training history plot not found.")
 
 with col2:
     st.subheader("Confusion Matrix")
-    cm_path = os.path.join(VIS_DIR, "confusion_matrix.png")
-    if os.path.exists(cm_path):
-        st.image(cm_path, caption="Confusion Matrix")
+    cm = load_visualization("confusion_matrix.png")
+    if cm is not None:
+        st.image(cm, caption="Confusion Matrix")
     else:
         st.warning("Confusion matrix plot not found.")
 
 # 4. Inference / Prediction
 st.header("3. Live Prediction")
-uploaded_file = st.file_uploader("Choose a flower image...", type=["jpg", "jpeg", "png"])
-
-if uploaded_file is not None:
-    col_img, col_pred = st.columns([1, 2])
-    
-    with col_img:
-        image = Image.open(uploaded_file)
-        st.image(image, caption='Uploaded Image', use_column_width=True)
-    
-    with col_pred:
-        if st.button("Predict"):
-            with st.spinner("Classifying..."):
-                try:
-                    # Reset file pointer
-                    uploaded_file.seek(0)
-                    files = {"file": uploaded_file}
-                    response = requests.post(f"{API_URL}/predict", files=files)
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        st.success(f"Prediction: **{result['class']}**")
-                        st.metric("Confidence", result['confidence'])
-                    else:
-                        st.error(f"Prediction failed: {response.text}")
-                except Exception as e:
-                    st.error(f"Error: {e}")
+uploaded_files = st.file_uploader(
+    "Choose flower images...", type=["jpg", "jpeg", "png"], accept_multiple_files=True
+)
+
+if uploaded_files:
+    if st.button("Predict"):
+        with st.spinner(f"Classifying {len(uploaded_files)} image(s)..."):
+            # Read bytes up front so worker threads never touch Streamlit objects
+            names = [f.name for f in uploaded_files]
+            datas = [f.getvalue() for f in uploaded_files]
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                results = list(executor.map(predict_image, names, datas))
+
+        for name, data, (result, error) in zip(names, datas, results):
+            col_img, col_pred = st.columns([1, 2])
+            with col_img:
+                st.image(data, caption=name, width="stretch")
+            with col_pred:
+                if result is not None:
+                    st.success(f"Prediction: **{result['class']}**")
+                    st.metric("Confidence", result['confidence'])
+                else:
+                    st.error(error)
+    else:
+        for f in uploaded_files:
+            col_img, _ = st.columns([1, 2])
+            with col_img:
+                st.image(f.getvalue(), caption=f.name, width="stretch")